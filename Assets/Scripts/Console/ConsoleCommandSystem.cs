@@ -21,9 +21,27 @@ public class ConsoleCommandSystem : MonoBehaviour
     
     private bool isConsoleVisible = false;
     private List<string> outputHistory = new List<string>();
-    
+
+    // Dispatch table for exact-match commands - one dictionary lookup instead of
+    // a chain of string comparisons; parameterized commands like connect(ip)
+    // still fall through to prefix matching in ProcessCommand
+    private Dictionary<string, System.Action> simpleCommands;
+
+    // Compiled once instead of re-parsing the pattern on every command
+    private static readonly Regex connectPattern = new Regex(@"connect\(([^)]+)\)", RegexOptions.IgnoreCase | RegexOptions.Compiled);
+    private static readonly Regex portPattern = new Regex(@"port\(([^)]+)\)", RegexOptions.IgnoreCase | RegexOptions.Compiled);
+    private static readonly Regex hostnamePattern = new Regex(@"^[a-zA-Z0-9.-]+$", RegexOptions.Compiled);
+
     void Start()
     {
+        simpleCommands = new Dictionary<string, System.Action>
+        {
+            { "help", ShowHelp },
+            { "clear", ClearOutput },
+            { "status", ShowConnectionStatus },
+            { "disconnect", ProcessDisconnectCommand }
+        };
+
         // Initialize console state
         if (consolePanel != null)
         {
@@ -103,17 +121,9 @@ public class ConsoleCommandSystem : MonoBehaviour
             // Convert to lowercase for easier matching
             string lowerCommand = command.ToLower();
             
-            if (lowerCommand == "help")
-            {
-                ShowHelp();
-            }
-            else if (lowerCommand == "clear")
+            if (simpleCommands.TryGetValue(lowerCommand, out var handler))
             {
-                ClearOutput();
-            }
-            else if (lowerCommand == "status")
-            {
-                ShowConnectionStatus();
+                handler();
             }
             else if (lowerCommand.StartsWith("connect(") && lowerCommand.EndsWith(")"))
             {
@@ -123,10 +133,6 @@ public class ConsoleCommandSystem : MonoBehaviour
             {
                 ProcessPortCommand(command);
             }
-            else if (lowerCommand == "disconnect")
-            {
-                ProcessDisconnectCommand();
-            }
             else
             {
                 AddOutput($"Unknown command: {command}. Type 'help' for available commands.");
@@ -141,7 +147,7 @@ public class ConsoleCommandSystem : MonoBehaviour
     void ProcessConnectCommand(string command)
     {
         // Extract IP address from connect(ip) format
-        Match match = Regex.Match(command, @"connect\(([^)]+)\)", RegexOptions.IgnoreCase);
+        Match match = connectPattern.Match(command);
         if (match.Success)
         {
             string ipAddress = match.Groups[1].Value.Trim();
@@ -170,7 +176,7 @@ public class ConsoleCommandSystem : MonoBehaviour
     void ProcessPortCommand(string command)
     {
         // Extract port number from port(number) format
-        Match match = Regex.Match(command, @"port\(([^)]+)\)", RegexOptions.IgnoreCase);
+        Match match = portPattern.Match(command);
         if (match.Success)
         {
             string portStr = match.Groups[1].Value.Trim();
@@ -257,24 +263,33 @@ public class ConsoleCommandSystem : MonoBehaviour
             return true;
         
         // Allow hostname format (basic check)
-        if (Regex.IsMatch(ip, @"^[a-zA-Z0-9.-]+$"))
+        if (hostnamePattern.IsMatch(ip))
             return true;
         
         return false;
     }
     
+    // Fixed help text built once at load - only the toggle-key line varies
+    private static readonly string[] helpLines =
+    {
+        "=== Console Commands ===",
+        "help - Show this help message",
+        "connect(ip) - Set server IP address",
+        "  Example: connect(192.168.1.1)",
+        "  Example: connect(localhost)",
+        "port(number) - Set server port",
+        "  Example: port(443)",
+        "status - Show current connection status",
+        "disconnect - Disconnect from server",
+        "clear - Clear console output"
+    };
+
     void ShowHelp()
     {
-        AddOutput("=== Console Commands ===");
-        AddOutput("help - Show this help message");
-        AddOutput("connect(ip) - Set server IP address");
-        AddOutput("  Example: connect(192.168.1.1)");
-        AddOutput("  Example: connect(localhost)");
-        AddOutput("port(number) - Set server port");
-        AddOutput("  Example: port(443)");
-        AddOutput("status - Show current connection status");
-        AddOutput("disconnect - Disconnect from server");
-        AddOutput("clear - Clear console output");
+        foreach (string line in helpLines)
+        {
+            AddOutput(line);
+        }
         AddOutput($"Press '{toggleKey}' or button to toggle console");
     }
     
@@ -30,7 +30,9 @@ public class GameManager : MonoBehaviour
         }
     }
     
-    private readonly Vector3[] trackGaragePositions = new Vector3[]
+    // Static: the garage layout is fixed track data, shared by every GameManager
+    // instance across scene reloads instead of being rebuilt per instance
+    private static readonly Vector3[] trackGaragePositions = new Vector3[]
     {
         new Vector3(66, -2, 0.8f),   // Position 0
         new Vector3(60, -2, 0.8f),   // Position 1
@@ -62,6 +64,10 @@ public class GameManager : MonoBehaviour
     [Header("Multiplayer Settings")]
     public float syncInterval = 0.1f;
     public float inputSyncInterval = 0.05f;
+
+    [Header("Debug")]
+    [Tooltip("Log every received position update. Allocates strings per packet - keep off outside debugging.")]
+    public bool verbosePositionLogging = false;
     
     private Dictionary<string, CarController> activePlayers = new Dictionary<string, CarController>();
     private string localPlayerId;
@@ -358,9 +364,9 @@ public class GameManager : MonoBehaviour
     
     private bool IsLocalPlayerActive()
     {
-        return !string.IsNullOrEmpty(localPlayerId) && 
-            activePlayers.ContainsKey(localPlayerId) && 
-            activePlayers[localPlayerId] != null;
+        return !string.IsNullOrEmpty(localPlayerId) &&
+            activePlayers.TryGetValue(localPlayerId, out CarController localController) &&
+            localController != null;
     }
 
     // In HandlePlayerReady method - update to use NetworkManager
@@ -429,10 +435,9 @@ public class GameManager : MonoBehaviour
             }
             
             // First check if player already exists to avoid dictionary key collision
-            if (activePlayers.ContainsKey(localPlayerId))
+            if (activePlayers.TryGetValue(localPlayerId, out CarController existingController))
             {
                 Debug.Log($"Player with ID {localPlayerId} already exists. Removing before respawning.");
-                CarController existingController = activePlayers[localPlayerId];
                 if (existingController != null && existingController.gameObject != null)
                 {
                     Destroy(existingController.gameObject);
@@ -474,10 +479,9 @@ public class GameManager : MonoBehaviour
             Quaternion spawnRotation = Quaternion.identity;
             
             // Check for existing player
-            if (activePlayers.ContainsKey(localPlayerId))
+            if (activePlayers.TryGetValue(localPlayerId, out CarController existingController))
             {
                 Debug.Log($"Player with ID {localPlayerId} already exists. Removing before respawning.");
-                CarController existingController = activePlayers[localPlayerId];
                 if (existingController != null && existingController.gameObject != null)
                 {
                     Destroy(existingController.gameObject);
@@ -520,9 +524,8 @@ public class GameManager : MonoBehaviour
         }
         
         // Remove any existing player with this ID first
-        if (activePlayers.ContainsKey(playerId))
+        if (activePlayers.TryGetValue(playerId, out CarController existingController))
         {
-            var existingController = activePlayers[playerId];
             if (existingController != null && existingController.gameObject != null)
             {
                 Debug.Log($"Destroying existing player object for {playerId}");
@@ -857,9 +860,9 @@ public class GameManager : MonoBehaviour
         if (string.IsNullOrEmpty(playerId))
         return false;
         
-        return activePlayers.ContainsKey(playerId) && 
-        activePlayers[playerId] != null && 
-        activePlayers[playerId].gameObject != null;
+        return activePlayers.TryGetValue(playerId, out CarController controller) &&
+        controller != null &&
+        controller.gameObject != null;
     }
 
     // Apply remote player state
@@ -868,7 +871,7 @@ public class GameManager : MonoBehaviour
         string playerId = stateData.playerId;
         
         // If we don't have this player yet, spawn them
-        if (!activePlayers.ContainsKey(playerId) || activePlayers[playerId] == null || activePlayers[playerId].gameObject == null)
+        if (!activePlayers.TryGetValue(playerId, out CarController existingPlayer) || existingPlayer == null || existingPlayer.gameObject == null)
         {
             Debug.Log($"URGENT: Player {playerId} not in activePlayers list or is invalid - forcing spawn");
             SpawnRemotePlayer(playerId, stateData.position, stateData.rotation);
@@ -970,16 +973,18 @@ public class GameManager : MonoBehaviour
     
     private void HandlePlayerPositionUpdate(PlayerUpdate playerUpdate)
     {
-        Debug.Log($"🔄 RECEIVED POSITION UPDATE from {playerUpdate.SessionId} at {playerUpdate.Position} (local player: {localPlayerId})");
-        
+        // This runs for every inbound position packet (20Hz x players), so the
+        // per-packet log strings are only built when explicitly enabled
+        if (verbosePositionLogging)
+        {
+            Debug.Log($"🔄 RECEIVED POSITION UPDATE from {playerUpdate.SessionId} at {playerUpdate.Position} (local player: {localPlayerId})");
+        }
+
         if (playerUpdate.SessionId == localPlayerId)
         {
-            Debug.Log($"⚠️  Skipping position update from local player {playerUpdate.SessionId}");
             return; // Skip our own updates
         }
-        
-        Debug.Log($"🎯 PROCESSING REMOTE PLAYER UPDATE: {playerUpdate.SessionId} - spawning/updating car");
-            
+
         // Convert PlayerUpdate to PlayerStateData for compatibility
         var stateData = new PlayerStateData
         {
@@ -990,8 +995,7 @@ public class GameManager : MonoBehaviour
             angularVelocity = Vector3.zero, // Not provided in new structure
             timestamp = playerUpdate.Timestamp
         };
-        
-        Debug.Log($"🎯 APPLYING PLAYER STATE for remote player {stateData.playerId}");
+
         ApplyPlayerState(stateData);
     }
     
@@ -39,6 +39,7 @@ public class SecureNetworkManager : MonoBehaviour
     [SerializeField] private int udpUpdateRateHz = 20; // Position updates per second
     [SerializeField] private int maxRetryAttempts = 3;
     [SerializeField] private bool enableCompression = false; // For large packets
+    [SerializeField] private int udpSocketBufferSize = 4 * 1024 * 1024; // Avoid kernel drops under position-update bursts
     
     [Header("Security Settings")]
     [SerializeField] private bool enforceEncryption = true;
@@ -66,6 +67,21 @@ public class SecureNetworkManager : MonoBehaviour
     private volatile bool _isAuthenticated = false;
     private volatile bool _isInRoom = false;
     
+    // Cached serializations of constant single-field commands (PING, LIST_ROOMS, ...)
+    // so they are encoded once instead of on every call
+    // Concurrent: populated lazily from whatever thread a sender's continuation
+    // lands on (ping loop, UI callbacks), so plain Dictionary would be unsafe
+    private readonly ConcurrentDictionary<string, string> _simpleCommandJsonCache = new ConcurrentDictionary<string, string>();
+    private readonly ConcurrentDictionary<string, byte[]> _simpleCommandBytesCache = new ConcurrentDictionary<string, byte[]>();
+
+    // Completed by the auth response handlers so auth waits are event-driven instead of polling
+    private TaskCompletionSource<bool> _authTcs;
+
+    // Serializes TCP writes and lets them reuse one growable scratch buffer
+    // instead of allocating a concatenated string + byte[] per message
+    private readonly SemaphoreSlim _tcpSendLock = new SemaphoreSlim(1, 1);
+    private byte[] _tcpSendBuffer = new byte[1024];
+
     // Session data
     private string _sessionId;
     private string _currentRoomId;
@@ -74,20 +90,43 @@ public class SecureNetworkManager : MonoBehaviour
     private UdpEncryption _udpCrypto;
     private IPEndPoint _serverUdpEndpoint;
     
-    // Rate limiting
-    private DateTime _lastTcpMessage = DateTime.MinValue;
-    private DateTime _lastUdpMessage = DateTime.MinValue;
-    private readonly object _rateLimitLock = new object();
+    // Rate limiting - TCP and UDP tracked independently so control traffic
+    // and position updates never block each other. The UDP side is lock-free:
+    // a single tick counter updated via Interlocked on the send hot path.
+    // Both timestamps are monotonic Stopwatch ticks, so wall-clock adjustments
+    // (NTP slew, DST) can never stall or burst the limiters.
+    private long _lastTcpMessageTimestamp = 0;
+    private long _lastUdpMessageTicks = 0;
+    private readonly object _tcpRateLimitLock = new object();
     
     // Message queuing for rate limiting
     private readonly ConcurrentQueue<Func<Task>> _tcpMessageQueue = new ConcurrentQueue<Func<Task>>();
     private readonly ConcurrentQueue<Func<Task>> _udpMessageQueue = new ConcurrentQueue<Func<Task>>();
+
+    // Reusable UDP message objects - position/input updates fire many times a
+    // second, so the message graphs are allocated once and refreshed per send.
+    // Only valid while refresh + serialization stay synchronous on the main
+    // thread (see the send internals and ProcessMessageQueues).
+    private PositionUpdateMessage _reusablePositionMessage;
+    private InputUpdateMessage _reusableInputMessage;
+
+    // Reusable packet buffers for the two UDP send paths (grown on demand by
+    // UdpEncryption.CreatePacket). Safe to reuse only because ProcessMessageQueues
+    // runs one UDP send to completion before starting the next.
+    private byte[] _positionPacketBuffer;
+    private byte[] _inputPacketBuffer;
+
+    // The UDP send currently in flight; ProcessMessageQueues holds back the next
+    // queued send until this Task completes so reused buffers are never torn
+    private Task _activeUdpSendTask;
     
     // Performance metrics
     private float _latency = 0f;
     private int _packetsSent = 0;
     private int _packetsReceived = 0;
-    private DateTime _lastLatencyCheck = DateTime.MinValue;
+    // Monotonic Stopwatch timestamp of the last PING - wall-clock time is
+    // subject to NTP steps and would corrupt the latency measurement
+    private long _lastLatencyTimestamp = 0;
     
     // Cancellation tokens for cleanup
     private CancellationTokenSource _connectionCts;
@@ -100,6 +139,56 @@ public class SecureNetworkManager : MonoBehaviour
         return JsonUtility.ToJson(obj);
     }
     
+    /// <summary>
+    /// Get the cached JSON for a parameterless command, serializing it on first use
+    /// </summary>
+    private string GetSimpleCommandJson(string command)
+    {
+        return _simpleCommandJsonCache.GetOrAdd(command, c => JsonUtility.ToJson(new SimpleCommand(c)));
+    }
+
+    /// <summary>
+    /// Send a parameterless command from its fully pre-encoded byte form -
+    /// serialization, UTF-8 encoding and the newline terminator are all paid
+    /// once per command for the lifetime of the process
+    /// </summary>
+    private async Task SendSimpleCommandAsync(string command)
+    {
+        var payload = _simpleCommandBytesCache.GetOrAdd(command,
+            c => Encoding.UTF8.GetBytes(GetSimpleCommandJson(c) + "\n"));
+
+        if (_sslStream == null || !_isConnected)
+        {
+            LogError("Cannot send TCP message - not connected or SSL stream not available");
+            return;
+        }
+
+        try
+        {
+            await _tcpSendLock.WaitAsync();
+            try
+            {
+                await _sslStream.WriteAsync(payload, 0, payload.Length);
+                await _sslStream.FlushAsync();
+            }
+            finally
+            {
+                _tcpSendLock.Release();
+            }
+
+            _packetsSent++;
+
+            if (logNetworkTraffic)
+            {
+                Log($"📤 TCP Sent: {GetSimpleCommandJson(command)}");
+            }
+        }
+        catch (Exception ex)
+        {
+            LogError($"Failed to send TCP message: {ex.Message}");
+        }
+    }
+
     private static T DeserializeFromJson<T>(string json)
     {
         try
@@ -148,11 +237,44 @@ public class SecureNetworkManager : MonoBehaviour
         StartCoroutine(ProcessMessageQueues());
     }
     
+    // Command dispatch table for inbound TCP messages - built once at startup,
+    // replacing the per-message string-comparison ladder with one hash lookup
+    private Dictionary<string, Action<Dictionary<string, object>>> _tcpCommandHandlers;
+
+    private void BuildTcpCommandHandlers()
+    {
+        _tcpCommandHandlers = new Dictionary<string, Action<Dictionary<string, object>>>
+        {
+            ["NAME_OK"] = HandleNameOk,
+            ["AUTH_OK"] = HandleAuthOk,
+            ["AUTH_FAILED"] = HandleAuthFailed,
+            ["ROOM_CREATED"] = HandleRoomCreated,
+            ["JOIN_OK"] = HandleRoomJoined,
+            ["ROOM_JOIN_OK"] = HandleRoomJoined,
+            ["ROOM_LEFT"] = HandleRoomLeft,
+            ["ROOM_LEFT_OK"] = HandleRoomLeft,
+            // Legacy support - old server format; the new ROOMS format is
+            // normally handled by HandleRoomListResponseDirect before dispatch
+            ["ROOM_LIST"] = HandleRoomList,
+            ["ROOMS"] = HandleRoomList,
+            ["ROOM_PLAYERS"] = HandleRoomPlayers,
+            ["GAME_STARTED"] = HandleGameStarted,
+            ["MESSAGE_SENT"] = HandleMessageSent,
+            ["RELAYED_MESSAGE"] = HandleRelayedMessage,
+            ["ERROR"] = HandleError,
+            ["PONG"] = _ => HandlePong(),
+            ["PLAYER_INFO"] = HandlePlayerInfo,
+            ["GAME_END"] = HandleGameEnd
+        };
+    }
+
     private void InitializeNetworkManager()
     {
         _connectionCts = new CancellationTokenSource();
         _messagingCts = new CancellationTokenSource();
-        
+
+        BuildTcpCommandHandlers();
+
         // Resolve server endpoint
         try
         {
@@ -198,9 +320,14 @@ public class SecureNetworkManager : MonoBehaviour
                 // 1. Create TCP client and connect to server
                 _tcpClient = new TcpClient();
                 await _tcpClient.ConnectAsync(serverHost, serverPort);
-                
+
                 if (_tcpClient.Connected)
                 {
+                    // Small latency-sensitive JSON messages must not sit in Nagle's
+                    // buffer waiting for an ACK - that costs up to 40ms per command
+                    _tcpClient.NoDelay = true;
+                    _tcpClient.Client.SetSocketOption(SocketOptionLevel.Socket, SocketOptionName.KeepAlive, true);
+
                     // 2. Setup TLS/SSL stream (accept self-signed certificates for MP-Server)
                     _sslStream = new SslStream(_tcpClient.GetStream(), false, ValidateServerCertificate);
                     await _sslStream.AuthenticateAsClientAsync(serverHost);
@@ -375,30 +502,33 @@ public class SecureNetworkManager : MonoBehaviour
     {
         try
         {
-            // Rate limiting
-            lock (_rateLimitLock)
+            // Rate limiting - claim a send slot under the lock, then wait it out
+            // asynchronously. The old code slept inside the lock, stalling the
+            // calling thread (and any other sender) for the full delay.
+            int delayMs = 0;
+            lock (_tcpRateLimitLock)
             {
-                var timeSinceLastMessage = (DateTime.UtcNow - _lastTcpMessage).TotalMilliseconds;
-                if (timeSinceLastMessage < rateLimitTcpMs)
+                var now = System.Diagnostics.Stopwatch.GetTimestamp();
+                var timeSinceLastMessage = (now - _lastTcpMessageTimestamp) * 1000.0 / System.Diagnostics.Stopwatch.Frequency;
+                if (_lastTcpMessageTimestamp != 0 && timeSinceLastMessage < rateLimitTcpMs)
                 {
-                    var delayMs = (int)(rateLimitTcpMs - timeSinceLastMessage);
-                    if (delayMs > 0)
-                    {
-                        Thread.Sleep(delayMs);
-                    }
+                    delayMs = (int)(rateLimitTcpMs - timeSinceLastMessage);
                 }
-                _lastTcpMessage = DateTime.UtcNow;
+                // Reserve the slot we'll actually send in so concurrent callers
+                // space themselves out correctly
+                _lastTcpMessageTimestamp = now + delayMs * System.Diagnostics.Stopwatch.Frequency / 1000;
             }
-            
-            // Serialize with Unity's JsonUtility
-            var json = SerializeToJson(message);
-            
-            _packetsSent++;
-            
-            if (logNetworkTraffic)
+
+            if (delayMs > 0)
             {
-                Log($"📤 TCP Sent: {json}");
+                await Task.Delay(delayMs);
             }
+            
+            // Serialize with Unity's JsonUtility, then hand off to the single
+            // real send path - this overload previously logged and counted the
+            // message but never wrote it to the stream
+            var json = SerializeToJson(message);
+            await SendTcpMessageAsync(json);
         }
         catch (Exception ex)
         {
@@ -406,74 +536,6 @@ public class SecureNetworkManager : MonoBehaviour
         }
     }
     
-    private IEnumerator ListenForTcpMessages()
-    {
-        var consecutiveErrors = 0;
-        const int maxConsecutiveErrors = 3;
-        
-        while (_isConnected && _tcpReader != null)
-        {
-            var readTask = _tcpReader?.ReadLineAsync();
-            if (readTask == null) break;
-            
-            // Wait for message with timeout
-            var startTime = Time.time;
-            while (!readTask.IsCompleted && !readTask.IsFaulted && !readTask.IsCanceled)
-            {
-                if (Time.time - startTime > 30f) // 30 second timeout
-                {
-                    LogError("TCP read timeout");
-                    consecutiveErrors++;
-                    break;
-                }
-                yield return null;
-            }
-            
-            if (readTask.IsCompleted && !readTask.IsFaulted)
-            {
-                var message = readTask.Result;
-                if (!string.IsNullOrEmpty(message))
-                {
-                    try
-                    {
-                        ProcessTcpMessage(message);
-                        consecutiveErrors = 0;
-                        _packetsReceived++;
-                    }
-                    catch (Exception ex)
-                    {
-                        LogError($"Error processing TCP message: {ex.Message}");
-                        consecutiveErrors++;
-                    }
-                }
-                else
-                {
-                    LogError("Received empty TCP message");
-                    consecutiveErrors++;
-                }
-            }
-            else if (readTask.IsFaulted)
-            {
-                LogError($"TCP read task faulted: {readTask.Exception?.Message}");
-                consecutiveErrors++;
-            }
-            
-            if (consecutiveErrors >= maxConsecutiveErrors)
-            {
-                LogError($"Too many consecutive TCP errors ({maxConsecutiveErrors}), disconnecting");
-                break;
-            }
-            
-            if (consecutiveErrors > 0)
-            {
-                yield return new WaitForSeconds(1f);
-            }
-        }
-        
-        LogError("TCP message listener ended");
-        _ = DisconnectAsync();
-    }
-    
     private void ProcessTcpMessage(string message)
     {
         try
@@ -482,7 +544,15 @@ public class SecureNetworkManager : MonoBehaviour
             {
                 Log($"📥 TCP Received: {message}");
             }
-            
+
+            // Fast path: PONG is the highest-frequency message (one per keepalive)
+            // and carries no payload, so skip the parse entirely
+            if (message == "{\"command\":\"PONG\"}" || message == "PONG")
+            {
+                HandlePong();
+                return;
+            }
+
             // Handle ROOM_LIST response directly with JsonUtility for proper array parsing
             if (message.Contains("\"command\":\"ROOM_LIST\""))
             {
@@ -526,68 +596,14 @@ public class SecureNetworkManager : MonoBehaviour
             }
             
             var command = jsonData["command"].ToString();
-            
-            switch (command)
+
+            if (_tcpCommandHandlers.TryGetValue(command, out var handler))
             {
-                case "NAME_OK":
-                    HandleNameOk(jsonData);
-                    break;
-                case "AUTH_OK":
-                    HandleAuthOk(jsonData);
-                    break;
-                case "AUTH_FAILED":
-                    HandleAuthFailed(jsonData);
-                    break;
-                case "ROOM_CREATED":
-                    Log($"Received ROOM_CREATED response: {message}");
-                    HandleRoomCreated(jsonData);
-                    break;
-                case "JOIN_OK":
-                case "ROOM_JOIN_OK":
-                    HandleRoomJoined(jsonData);
-                    break;
-                case "ROOM_LEFT":
-                case "ROOM_LEFT_OK":
-                    HandleRoomLeft(jsonData);
-                    break;
-                case "ROOM_LIST":
-                    // Legacy support - old server format
-                    HandleRoomList(jsonData);
-                    break;
-                case "ROOMS":
-                    // This should be handled by HandleRoomListResponseDirect above
-                    // But adding fallback support here
-                    Log("ROOMS command reached switch statement - should have been handled directly");
-                    HandleRoomList(jsonData);
-                    break;
-                case "ROOM_PLAYERS":
-                    HandleRoomPlayers(jsonData);
-                    break;
-                case "GAME_STARTED":
-                    HandleGameStarted(jsonData);
-                    break;
-                case "MESSAGE_SENT":
-                    HandleMessageSent(jsonData);
-                    break;
-                case "RELAYED_MESSAGE":
-                    HandleRelayedMessage(jsonData);
-                    break;
-                case "ERROR":
-                    Log($"Received ERROR response: {message}");
-                    HandleError(jsonData);
-                    break;
-                case "PONG":
-                    HandlePong();
-                    break;
-                case "PLAYER_INFO":
-                    HandlePlayerInfo(jsonData);
-                    break;
-                case "GAME_END":
-                    HandleGameEnd(jsonData);
-                    break;
-                default:
-                    Log($"Unhandled command: {command}");
-                    break;
+                handler(jsonData);
+            }
+            else
+            {
+                Log($"Unhandled command: {command}");
             }
         }
         catch (Exception ex)
@@ -600,9 +616,22 @@ public class SecureNetworkManager : MonoBehaviour
     {
         Log("Re-authentication successful via AUTH_OK");
         _isAuthenticated = true;
+        _authTcs?.TrySetResult(true);
         OnAuthenticationChanged?.Invoke(true);
         Log($"Authentication status updated to: {_isAuthenticated}");
     }
+
+    /// <summary>
+    /// Wait until the pending auth request is answered or the timeout elapses
+    /// </summary>
+    private async Task WaitForAuthResponseAsync(TimeSpan timeout)
+    {
+        var tcs = _authTcs;
+        if (tcs == null) return;
+
+        await Task.WhenAny(tcs.Task, Task.Delay(timeout));
+        _authTcs = null;
+    }
     
     /// <summary>
     /// Parse JSON message into a Dictionary for Unity compatibility
@@ -745,7 +774,8 @@ public class SecureNetworkManager : MonoBehaviour
     {
         Log("Authentication successful via NAME_OK");
         _isAuthenticated = true;
-        
+        _authTcs?.TrySetResult(true);
+
         // Initialize UDP encryption with session ID
         if (!string.IsNullOrEmpty(_sessionId))
         {
@@ -756,10 +786,11 @@ public class SecureNetworkManager : MonoBehaviour
         OnAuthenticationChanged?.Invoke(true);
         Log($"Authentication status updated to: {_isAuthenticated}");
     }
-    
+
     private void HandleAuthFailed(Dictionary<string, object> data)
     {
         var message = data.ContainsKey("message") ? data["message"].ToString() : "Unknown error";
+        _authTcs?.TrySetResult(false);
         LogError($"Authentication failed: {message}");
         OnError?.Invoke($"Authentication failed: {message}");
     }
@@ -993,11 +1024,12 @@ public class SecureNetworkManager : MonoBehaviour
     }
      private void HandlePong()
     {
-        // Calculate latency
-        var now = DateTime.UtcNow;
-        if (_lastLatencyCheck != DateTime.MinValue)
+        // Calculate latency from the monotonic clock
+        var last = Interlocked.Read(ref _lastLatencyTimestamp);
+        if (last != 0)
         {
-            _latency = (float)(now - _lastLatencyCheck).TotalMilliseconds;
+            var elapsed = System.Diagnostics.Stopwatch.GetTimestamp() - last;
+            _latency = (float)(elapsed * 1000.0 / System.Diagnostics.Stopwatch.Frequency);
         }
     }
 
@@ -1071,51 +1103,50 @@ public class SecureNetworkManager : MonoBehaviour
     {
         try
         {
-            // Rate limiting
-            lock (_rateLimitLock)
+            // Rate limiting - lock-free: claim the send slot with a single
+            // compare-exchange on the tick counter; losers simply skip the update
+            var nowTicks = System.Diagnostics.Stopwatch.GetTimestamp();
+            var lastTicks = Interlocked.Read(ref _lastUdpMessageTicks);
+            if ((nowTicks - lastTicks) < rateLimitUdpMs * System.Diagnostics.Stopwatch.Frequency / 1000 ||
+                Interlocked.CompareExchange(ref _lastUdpMessageTicks, nowTicks, lastTicks) != lastTicks)
             {
-                var timeSinceLastMessage = (DateTime.UtcNow - _lastUdpMessage).TotalMilliseconds;
-                if (timeSinceLastMessage < rateLimitUdpMs)
-                {
-                    return; // Skip this update
-                }
-                _lastUdpMessage = DateTime.UtcNow;
+                return; // Skip this update
             }
             
-            // Create update message in MP-Server format
-            var update = new PositionUpdateMessage(_sessionId, position, rotation);
-            
-            // Send encrypted UDP packet using UdpEncryption
-            if (_udpClient != null && _isConnected)
+            // CanSendUdp vetted the session at enqueue time; one re-validation here
+            // covers a disconnect that happened while the update sat in the queue
+            if (_udpClient == null || !_isConnected)
             {
-                try
-                {
-                    // Use UdpEncryption instance to create encrypted packet
-                    if (_udpCrypto != null)
-                    {
-                        var encryptedData = _udpCrypto.CreatePacket(update);
-                        await _udpClient.SendAsync(encryptedData, encryptedData.Length, _serverUdpEndpoint);
-                        _packetsSent++;
-                        
-                        if (logNetworkTraffic)
-                        {
-                            Log($"📤 UDP Position: ({position.x:F2}, {position.y:F2}, {position.z:F2})");
-                        }
-                    }
-                    else
-                    {
-                        LogError("UDP encryption not initialized - cannot send position update");
-                    }
-                }
-                catch (Exception ex)
-                {
-                    LogError($"Failed to send encrypted UDP position update: {ex.Message}");
-                }
+                return;
+            }
+            if (_udpCrypto == null)
+            {
+                LogError("UDP encryption not initialized - cannot send position update");
+                return;
+            }
+
+            // Refresh the reusable update message in MP-Server format. Sharing one
+            // instance is safe only because the refresh and CreatePacket
+            // serialization run synchronously on the main thread before the first
+            // await, and ProcessMessageQueues runs one UDP send at a time - moving
+            // sends off the main thread would break this.
+            if (_reusablePositionMessage == null)
+                _reusablePositionMessage = new PositionUpdateMessage(_sessionId, position, rotation);
+            else
+                _reusablePositionMessage.Set(_sessionId, position, rotation);
+
+            var packetLength = _udpCrypto.CreatePacket(_reusablePositionMessage, ref _positionPacketBuffer);
+            await _udpClient.SendAsync(_positionPacketBuffer, packetLength);
+            _packetsSent++;
+
+            if (logNetworkTraffic)
+            {
+                Log($"📤 UDP Position: ({position.x:F2}, {position.y:F2}, {position.z:F2})");
             }
         }
         catch (Exception ex)
         {
-            LogError($"Failed to send position update: {ex.Message}");
+            LogError($"Failed to send encrypted UDP position update: {ex.Message}");
         }
     }
     
@@ -1123,40 +1154,36 @@ public class SecureNetworkManager : MonoBehaviour
     {
         try
         {
-            // Create input message in MP-Server format
-            var input = new InputUpdateMessage(_sessionId, steering, throttle, brake);
-            
-            // Send encrypted UDP packet using UdpEncryption
-            if (_udpClient != null && _isConnected)
+            // Same single re-validation as the position path
+            if (_udpClient == null || !_isConnected)
             {
-                try
-                {
-                    // Use UdpEncryption instance to create encrypted packet
-                    if (_udpCrypto != null)
-                    {
-                        var encryptedData = _udpCrypto.CreatePacket(input);
-                        await _udpClient.SendAsync(encryptedData, encryptedData.Length, _serverUdpEndpoint);
-                        _packetsSent++;
-                        
-                        if (logNetworkTraffic)
-                        {
-                            Log($"📤 UDP Input: S:{steering:F2} T:{throttle:F2} B:{brake:F2}");
-                        }
-                    }
-                    else
-                    {
-                        LogError("UDP encryption not initialized - cannot send input update");
-                    }
-                }
-                catch (Exception ex)
-                {
-                    LogError($"Failed to send encrypted UDP input update: {ex.Message}");
-                }
+                return;
+            }
+            if (_udpCrypto == null)
+            {
+                LogError("UDP encryption not initialized - cannot send input update");
+                return;
+            }
+
+            // Refresh the reusable input message in MP-Server format - same
+            // main-thread/single-send invariant as the position path above
+            if (_reusableInputMessage == null)
+                _reusableInputMessage = new InputUpdateMessage(_sessionId, steering, throttle, brake);
+            else
+                _reusableInputMessage.Set(_sessionId, steering, throttle, brake);
+
+            var packetLength = _udpCrypto.CreatePacket(_reusableInputMessage, ref _inputPacketBuffer);
+            await _udpClient.SendAsync(_inputPacketBuffer, packetLength);
+            _packetsSent++;
+
+            if (logNetworkTraffic)
+            {
+                Log($"📤 UDP Input: S:{steering:F2} T:{throttle:F2} B:{brake:F2}");
             }
         }
         catch (Exception ex)
         {
-            LogError($"Failed to send input update: {ex.Message}");
+            LogError($"Failed to send encrypted UDP input update: {ex.Message}");
         }
     }
     
@@ -1177,47 +1204,72 @@ public class SecureNetworkManager : MonoBehaviour
             
             // Initialize cancellation token for UDP receiving
             _udpReceiveCancellation = new CancellationTokenSource();
-            
+
+            // Receive into one pooled buffer instead of letting UdpClient.ReceiveAsync
+            // allocate a fresh array per datagram - only the server sends to this
+            // socket, so plain ReceiveAsync on the underlying Socket is sufficient
+            var receiveBuffer = new byte[65536];
+            var receiveSegment = new ArraySegment<byte>(receiveBuffer);
+
             while (_isConnected && _udpClient != null && !_udpReceiveCancellation.Token.IsCancellationRequested)
             {
                 try
                 {
-                    var result = await _udpClient.ReceiveAsync();
-                    var encryptedData = result.Buffer;
-                    
+                    var receivedBytes = await _udpClient.Client.ReceiveAsync(receiveSegment, SocketFlags.None);
+
                     // Decrypt and process UDP message
                     if (_udpCrypto != null)
                     {
-                        // Try to parse as server position update (exact server format)
-                        var serverUpdate = _udpCrypto.ParsePacket<ServerPlayerUpdate>(encryptedData);
-                        if (!string.IsNullOrEmpty(serverUpdate.sessionId) && serverUpdate.command == "UPDATE")
+                        // Decrypt once, then pick the target type from the JSON content -
+                        // the old double ParsePacket call ran AES twice per datagram
+                        var json = _udpCrypto.DecryptPacket(receiveBuffer, receivedBytes);
+                        if (string.IsNullOrEmpty(json))
                         {
                             if (logNetworkTraffic)
                             {
-                                Log($"📥 UDP Position Update: {serverUpdate.sessionId} at {serverUpdate.position}");
+                                Log("📥 UDP: Failed to decrypt packet");
                             }
-                            
-                            // Dispatch to main thread for Unity operations (including Time.time access)
-                            UnityMainThreadDispatcher.Instance().Enqueue(() =>
+                            continue;
+                        }
+
+                        // Route on a cheap probe of the command token instead of
+                        // speculatively deserializing each candidate type in turn -
+                        // input packets previously paid a full failed parse as
+                        // ServerPlayerUpdate before being tried as PlayerInput.
+                        // The bare-token probe tolerates whatever whitespace the
+                        // server's serializer emits, and a probe hit that fails to
+                        // parse still falls through to the input form below.
+                        if (json.Contains("\"UPDATE\""))
+                        {
+                            var serverUpdate = DeserializeFromJson<ServerPlayerUpdate>(json);
+                            if (!string.IsNullOrEmpty(serverUpdate.sessionId))
                             {
-                                // Convert to our internal format on main thread
-                                var positionUpdate = new PlayerUpdate
+                                if (logNetworkTraffic)
                                 {
-                                    SessionId = serverUpdate.sessionId,
-                                    Position = serverUpdate.position,
-                                    Rotation = serverUpdate.rotation,
-                                    Velocity = Vector3.zero, // Not provided by server
-                                    AngularVelocity = Vector3.zero, // Not provided by server
-                                    Timestamp = Time.time // Now safe to call on main thread
-                                };
-                                
-                                OnPlayerPositionUpdate?.Invoke(positionUpdate);
-                            });
-                            continue;
+                                    Log($"📥 UDP Position Update: {serverUpdate.sessionId} at {serverUpdate.position}");
+                                }
+
+                                // Dispatch to main thread for Unity operations (including Time.time access)
+                                UnityMainThreadDispatcher.Instance().Enqueue(() =>
+                                {
+                                    // Convert to our internal format on main thread
+                                    var positionUpdate = new PlayerUpdate
+                                    {
+                                        SessionId = serverUpdate.sessionId,
+                                        Position = serverUpdate.position,
+                                        Rotation = serverUpdate.rotation,
+                                        Velocity = Vector3.zero, // Not provided by server
+                                        AngularVelocity = Vector3.zero, // Not provided by server
+                                        Timestamp = Time.time // Now safe to call on main thread
+                                    };
+
+                                    OnPlayerPositionUpdate?.Invoke(positionUpdate);
+                                });
+                                continue;
+                            }
                         }
-                        
-                        // Try to parse as input update (keep existing logic)
-                        var inputUpdate = _udpCrypto.ParsePacket<PlayerInput>(encryptedData);
+                        // Not routed as a position update - try the input form
+                        var inputUpdate = DeserializeFromJson<PlayerInput>(json);
                         if (!string.IsNullOrEmpty(inputUpdate.SessionId))
                         {
                             // Dispatch to main thread for Unity operations
@@ -1227,7 +1279,7 @@ public class SecureNetworkManager : MonoBehaviour
                             });
                             continue;
                         }
-                        
+
                         if (logNetworkTraffic)
                         {
                             Log("📥 UDP: Unknown message type received");
@@ -1277,7 +1329,18 @@ public class SecureNetworkManager : MonoBehaviour
             
             // Initialize UDP client for game data
             _udpClient = new UdpClient();
-            Log("UDP client initialized for game session");
+
+            // Enlarge the OS-level buffers so a burst of position updates from a
+            // full room is queued by the kernel instead of silently dropped.
+            // The OS may cap these below the requested size (e.g. net.core.rmem_max on Linux).
+            _udpClient.Client.ReceiveBufferSize = udpSocketBufferSize;
+            _udpClient.Client.SendBufferSize = udpSocketBufferSize;
+
+            // Connect the socket to the (already resolved) server endpoint so each
+            // send skips per-packet address handling, and the kernel filters out
+            // datagrams from anyone other than the server
+            _udpClient.Connect(_serverUdpEndpoint);
+            Log($"UDP client initialized for game session (socket buffers: {_udpClient.Client.ReceiveBufferSize}/{_udpClient.Client.SendBufferSize} bytes)");
             
             // Start UDP receiving for real-time game data
             _ = Task.Run(StartUdpReceiving);
@@ -1418,10 +1481,7 @@ public class SecureNetworkManager : MonoBehaviour
         try
         {
             // Send LEAVE_ROOM command as newline-delimited JSON
-            var leaveCommand = new SimpleCommand("LEAVE_ROOM");
-            
-            string jsonCommand = JsonUtility.ToJson(leaveCommand);
-            await SendTcpMessageAsync(jsonCommand);
+            await SendSimpleCommandAsync("LEAVE_ROOM");
             
             Log("Sent leave room request");
             
@@ -1448,10 +1508,7 @@ public class SecureNetworkManager : MonoBehaviour
         try
         {
             // Send START_GAME command as newline-delimited JSON
-            var startCommand = new SimpleCommand("START_GAME");
-            
-            string jsonCommand = JsonUtility.ToJson(startCommand);
-            await SendTcpMessageAsync(jsonCommand);
+            await SendSimpleCommandAsync("START_GAME");
             
             Log("Sent start game request");
             
@@ -1486,10 +1543,7 @@ public class SecureNetworkManager : MonoBehaviour
             }
             
             // Send LIST_ROOMS command to server using proper JSON format
-            var listRoomsRequest = new SimpleCommand("LIST_ROOMS");
-            
-            string json = JsonUtility.ToJson(listRoomsRequest);
-            await SendTcpMessageAsync(json);
+            await SendSimpleCommandAsync("LIST_ROOMS");
             
             Log("Requesting room list from server");
         }
@@ -1561,10 +1615,7 @@ public class SecureNetworkManager : MonoBehaviour
         try
         {
             // Send PLAYER_INFO command as newline-delimited JSON
-            var playerInfoCommand = new SimpleCommand("PLAYER_INFO");
-            
-            string json = JsonUtility.ToJson(playerInfoCommand);
-            await SendTcpMessageAsync(json);
+            await SendSimpleCommandAsync("PLAYER_INFO");
             
             Log("Requested player info");
         }
@@ -1595,15 +1646,20 @@ public class SecureNetworkManager : MonoBehaviour
                 }
             }
             
-            // Process UDP message queue
-            while (_udpMessageQueue.TryDequeue(out var udpTask))
+            // Process UDP message queue - strictly one send in flight at a time:
+            // the send internals reuse message objects and packet buffers, so the
+            // next task must not start until the previous send's Task completes.
+            // Anything still queued is picked up on the next 10ms tick.
+            while ((_activeUdpSendTask == null || _activeUdpSendTask.IsCompleted) &&
+                   _udpMessageQueue.TryDequeue(out var udpTask))
             {
                 try
                 {
-                    _ = udpTask(); // Fire and forget - don't await in coroutine
+                    _activeUdpSendTask = udpTask();
                 }
                 catch (Exception ex)
                 {
+                    _activeUdpSendTask = null;
                     LogError($"Error processing UDP message from queue: {ex.Message}");
                 }
             }
@@ -1882,10 +1938,30 @@ public class SecureNetworkManager : MonoBehaviour
 
         try
         {
-            byte[] data = Encoding.UTF8.GetBytes(message + "\n");
-            await _sslStream.WriteAsync(data, 0, data.Length);
-            await _sslStream.FlushAsync();
-            
+            await _tcpSendLock.WaitAsync();
+            try
+            {
+                // Encode into the reused scratch buffer with the newline appended
+                // in place - no per-message string concat or byte[] allocation
+                int maxLength = Encoding.UTF8.GetMaxByteCount(message.Length) + 1;
+                if (_tcpSendBuffer.Length < maxLength)
+                {
+                    _tcpSendBuffer = new byte[Math.Max(maxLength, _tcpSendBuffer.Length * 2)];
+                }
+
+                int length = Encoding.UTF8.GetBytes(message, 0, message.Length, _tcpSendBuffer, 0);
+                _tcpSendBuffer[length++] = (byte)'\n';
+
+                await _sslStream.WriteAsync(_tcpSendBuffer, 0, length);
+                await _sslStream.FlushAsync();
+            }
+            finally
+            {
+                _tcpSendLock.Release();
+            }
+
+            _packetsSent++;
+
             if (logNetworkTraffic)
             {
                 Log($"📤 TCP Sent: {message}");
@@ -1897,28 +1973,6 @@ public class SecureNetworkManager : MonoBehaviour
         }
     }
     
-    /// <summary>
-    /// Read TCP message using MP-Server protocol
-    /// </summary>
-    private async Task<string> ReadTcpMessage()
-    {
-        if (_sslStream == null)
-        {
-            throw new Exception("SSL stream not available");
-        }
-
-        byte[] buffer = new byte[4096];
-        int bytesRead = await _sslStream.ReadAsync(buffer, 0, buffer.Length);
-        string message = Encoding.UTF8.GetString(buffer, 0, bytesRead).Trim();
-        
-        if (logNetworkTraffic)
-        {
-            Log($"📥 TCP Received: {message}");
-        }
-        
-        return message;
-    }
-    
     /// <summary>
     /// Send ping to server to keep connection alive
     /// </summary>
@@ -1931,14 +1985,10 @@ public class SecureNetworkManager : MonoBehaviour
 
         try
         {
-            _lastLatencyCheck = DateTime.UtcNow;
-            
-            var pingCommand = new SimpleCommand("PING");
-            
-            string json = JsonUtility.ToJson(pingCommand);
-            Log($"📤 Sending PING: {json}");
-            await SendTcpMessageAsync(json);
-            await SendTcpMessageAsync(json);
+            Interlocked.Exchange(ref _lastLatencyTimestamp, System.Diagnostics.Stopwatch.GetTimestamp());
+
+            Log($"📤 Sending PING: {GetSimpleCommandJson("PING")}");
+            await SendSimpleCommandAsync("PING");
             
             if (enableDebugLogs)
             {
@@ -1963,13 +2013,9 @@ public class SecureNetworkManager : MonoBehaviour
 
         try
         {
-            var byeCommand = new
-            {
-                command = "BYE"
-            };
-            
-            string json = JsonUtility.ToJson(byeCommand);
-            await SendTcpMessageAsync(json);
+            // Note: this previously serialized an anonymous type, which JsonUtility
+            // renders as "{}" - the server never actually saw the BYE command
+            await SendSimpleCommandAsync("BYE");
             
             Log("Sent BYE command to server");
         }
@@ -2023,23 +2069,19 @@ public class SecureNetworkManager : MonoBehaviour
             
             var authRequest = new AuthRequest(playerName, playerPassword ?? "");
             
+            _authTcs = new TaskCompletionSource<bool>(TaskCreationOptions.RunContinuationsAsynchronously);
+
             string json = JsonUtility.ToJson(authRequest);
             Log($"📤 Re-auth JSON being sent: {json}");
             await SendTcpMessageAsync(json);
             
             Log($"Sent re-authentication request for player: {playerName}");
             
-            // Wait for authentication response (with timeout)
-            var startTime = DateTime.Now;
-            var timeout = TimeSpan.FromSeconds(10);
-            
+            // Wait for the authentication response; the response handlers complete
+            // _authTcs, so this wakes as soon as the server answers instead of
+            // polling every 100ms
             Log("Waiting for authentication response...");
-            
-            while (!_isAuthenticated && (DateTime.Now - startTime) < timeout)
-            {
-                await Task.Delay(100);
-            }
-            
+            await WaitForAuthResponseAsync(TimeSpan.FromSeconds(10));
             Log($"Authentication wait completed. Authenticated: {_isAuthenticated}");
             
             if (_isAuthenticated)
@@ -2237,23 +2279,19 @@ public class SecureNetworkManager : MonoBehaviour
             // Send NAME command with JSON format using proper serializable class
             var authRequest = new AuthRequest(playerName, playerPassword);
             
+            _authTcs = new TaskCompletionSource<bool>(TaskCreationOptions.RunContinuationsAsynchronously);
+
             string json = JsonUtility.ToJson(authRequest);
             Log($"📤 Sending auth JSON: {json}");
             await SendTcpMessageAsync(json);
             
             Log($"Sent authentication request for player: {playerName}");
             
-            // Wait for authentication response (with timeout)
-            var startTime = DateTime.Now;
-            var timeout = TimeSpan.FromSeconds(10);
-            
+            // Wait for the authentication response; the response handlers complete
+            // _authTcs, so this wakes as soon as the server answers instead of
+            // polling every 100ms
             Log("Waiting for authentication response...");
-            
-            while (!_isAuthenticated && (DateTime.Now - startTime) < timeout)
-            {
-                await Task.Delay(100);
-            }
-            
+            await WaitForAuthResponseAsync(TimeSpan.FromSeconds(10));
             Log($"Authentication wait completed. Authenticated: {_isAuthenticated}");
             
             if (_isAuthenticated)
@@ -2489,6 +2527,16 @@ internal class PositionUpdateMessage
         rotation = new QuaternionData(rot);
         timestamp = DateTimeOffset.UtcNow.ToUnixTimeMilliseconds();
     }
+
+    // Refresh an existing instance for the next send - position updates are the
+    // hottest send path, so the message graph is built once and reused
+    public void Set(string session, Vector3 pos, Quaternion rot)
+    {
+        sessionId = session;
+        position.Set(pos);
+        rotation.Set(rot);
+        timestamp = DateTimeOffset.UtcNow.ToUnixTimeMilliseconds();
+    }
 }
 
 [System.Serializable]
@@ -2510,6 +2558,15 @@ internal class InputUpdateMessage
         brake = brakeVal;
         timestamp = DateTimeOffset.UtcNow.ToUnixTimeMilliseconds();
     }
+
+    public void Set(string session, float steer, float throttleVal, float brakeVal)
+    {
+        sessionId = session;
+        steering = steer;
+        throttle = throttleVal;
+        brake = brakeVal;
+        timestamp = DateTimeOffset.UtcNow.ToUnixTimeMilliseconds();
+    }
 }
 
 [System.Serializable]
@@ -2525,6 +2582,13 @@ internal class Vector3Data
         y = v.y;
         z = v.z;
     }
+
+    public void Set(Vector3 v)
+    {
+        x = v.x;
+        y = v.y;
+        z = v.z;
+    }
 }
 
 [System.Serializable]
@@ -2542,6 +2606,14 @@ internal class QuaternionData
         z = q.z;
         w = q.w;
     }
+
+    public void Set(Quaternion q)
+    {
+        x = q.x;
+        y = q.y;
+        z = q.z;
+        w = q.w;
+    }
 }
 
     // Serializable classes for network messages
@@ -42,6 +42,11 @@ public class UdpEncryption
     }
     
     public string Decrypt(byte[] encryptedData)
+    {
+        return Decrypt(encryptedData, 0, encryptedData.Length);
+    }
+
+    public string Decrypt(byte[] encryptedData, int offset, int count)
     {
         try
         {
@@ -50,9 +55,9 @@ public class UdpEncryption
             aes.IV = _iv;
             aes.Mode = CipherMode.CBC;
             aes.Padding = PaddingMode.PKCS7;
-            
+
             using var decryptor = aes.CreateDecryptor();
-            var decryptedBytes = decryptor.TransformFinalBlock(encryptedData, 0, encryptedData.Length);
+            var decryptedBytes = decryptor.TransformFinalBlock(encryptedData, offset, count);
             return Encoding.UTF8.GetString(decryptedBytes);
         }
         catch (Exception)
@@ -77,25 +82,66 @@ public class UdpEncryption
         return packet;
     }
     
+    /// <summary>
+    /// Decrypt packet to its JSON payload without deserializing (MP-Server format)
+    /// Lets callers decrypt once and choose the target type afterwards
+    /// </summary>
+    public string DecryptPacket(byte[] packetData)
+    {
+        return DecryptPacket(packetData, packetData.Length);
+    }
+
+    /// <summary>
+    /// Build an encrypted packet into a caller-owned reusable buffer, growing it
+    /// as needed, and return the packet length. Skips the fresh packet array and
+    /// header concat of CreatePacket for high-rate senders.
+    /// </summary>
+    public int CreatePacket(object data, ref byte[] buffer)
+    {
+        var json = JsonUtility.ToJson(data);
+        var encryptedData = Encrypt(json);
+        var packetLength = 4 + encryptedData.Length;
+
+        if (buffer == null || buffer.Length < packetLength)
+            buffer = new byte[Math.Max(packetLength, 512)];
+
+        // Write the length header in place (little-endian, matching
+        // BitConverter.GetBytes) instead of allocating a 4-byte array for it
+        buffer[0] = (byte)encryptedData.Length;
+        buffer[1] = (byte)(encryptedData.Length >> 8);
+        buffer[2] = (byte)(encryptedData.Length >> 16);
+        buffer[3] = (byte)(encryptedData.Length >> 24);
+        encryptedData.CopyTo(buffer, 4);
+
+        return packetLength;
+    }
+
+    /// <summary>
+    /// Decrypt a packet occupying the first packetLength bytes of a reusable
+    /// receive buffer, so callers can pool buffers across datagrams
+    /// </summary>
+    public string DecryptPacket(byte[] packetData, int packetLength)
+    {
+        if (packetLength < 4 || packetLength > packetData.Length)
+            return null;
+
+        var length = BitConverter.ToInt32(packetData, 0);
+        if (length != packetLength - 4 || length <= 0)
+            return null;
+
+        // Decrypt straight from the packet buffer - no intermediate ciphertext copy
+        return Decrypt(packetData, 4, length);
+    }
+
     /// <summary>
     /// Parse encrypted packet and deserialize (MP-Server format)
     /// </summary>
     public T ParsePacket<T>(byte[] packetData)
     {
-        if (packetData.Length < 4)
-            return default(T);
-        
-        var length = BitConverter.ToInt32(packetData, 0);
-        if (length != packetData.Length - 4 || length <= 0)
-            return default(T);
-        
-        var encryptedData = new byte[length];
-        Array.Copy(packetData, 4, encryptedData, 0, length);
-        
-        var json = Decrypt(encryptedData);
+        var json = DecryptPacket(packetData);
         if (string.IsNullOrEmpty(json))
             return default(T);
-        
+
         try
         {
             return JsonUtility.FromJson<T>(json);
@@ -7,6 +7,9 @@ using System.Threading.Tasks;
 public class UnityMainThreadDispatcher : MonoBehaviour
 {
     private static readonly Queue<Action> _executionQueue = new Queue<Action>();
+    // Drain target owned by the main thread - lets Update run callbacks without
+    // holding the queue lock, so background enqueuers never wait on Unity work
+    private static readonly Queue<Action> _pendingActions = new Queue<Action>();
     private static UnityMainThreadDispatcher _instance = null;
 
     public static UnityMainThreadDispatcher Instance()
@@ -44,13 +47,20 @@ public class UnityMainThreadDispatcher : MonoBehaviour
 
     void Update()
     {
+        // Snapshot the queue under the lock, then invoke outside it so network
+        // threads can keep enqueueing while callbacks run
         lock(_executionQueue)
         {
             while (_executionQueue.Count > 0)
             {
-                _executionQueue.Dequeue().Invoke();
+                _pendingActions.Enqueue(_executionQueue.Dequeue());
             }
         }
+
+        while (_pendingActions.Count > 0)
+        {
+            _pendingActions.Dequeue().Invoke();
+        }
     }
 
     public void Enqueue(Action action)
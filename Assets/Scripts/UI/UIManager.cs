@@ -175,7 +175,9 @@ public class UIManager : MonoBehaviour
     
     // Room management - Updated for MP-Server protocol
     private List<RoomInfo> roomList = new List<RoomInfo>();
-    private List<string> playersInRoom = new List<string>();
+    // HashSet: membership checks on join/leave are O(1) and duplicates are
+    // rejected by Add itself instead of a Contains-then-Add pair
+    private HashSet<string> playersInRoom = new HashSet<string>();
     private string currentRoomId;
     private string currentRoomName;
     private bool isHost = false;
@@ -1744,9 +1746,8 @@ private void SetupProfileItemManually(GameObject profileItem, ProfileData profil
                 
                 // Check if we're added to the room ourselves
                 string clientId = SecureNetworkManager.Instance.GetClientId();
-                if (!playersInRoom.Contains(clientId))
+                if (playersInRoom.Add(clientId))
                 {
-                    playersInRoom.Add(clientId);
                     Debug.Log($"Added self to player list: {clientId}");
                 }
                 
@@ -1819,9 +1820,8 @@ private void SetupProfileItemManually(GameObject profileItem, ProfileData profil
         if (message.ContainsKey("client_id"))
         {
             string playerId = message["client_id"].ToString();
-            if (!playersInRoom.Contains(playerId))
+            if (playersInRoom.Add(playerId))
             {
-                playersInRoom.Add(playerId);
                 UpdateRoomInfo();
                 ShowNotification($"Player {playerId} joined the room");
             }
@@ -1833,9 +1833,8 @@ private void SetupProfileItemManually(GameObject profileItem, ProfileData profil
         if (message.ContainsKey("player_id"))
         {
             string playerId = message["player_id"].ToString();
-            if (playersInRoom.Contains(playerId))
+            if (playersInRoom.Remove(playerId))
             {
-                playersInRoom.Remove(playerId);
                 UpdateRoomInfo();
                 ShowNotification($"Player {playerId} left the room");
             }